@@ -13,6 +13,7 @@ from app.schemas.auth import (
 )
 from datetime import timedelta
 from app.core.config import get_settings
+from app.utils.dashboard_cache import dashboard_cache
 from jose import JWTError, jwt
 import logging
 
@@ -88,7 +89,8 @@ async def login(
         # Get department details if available
         department_name = None
         department_code = None
-        if user.department:
+        # Check the FK column; only load the department when there is one
+        if user.department_id is not None:
             department_name = user.department.name
             department_code = user.department.code
         
@@ -96,7 +98,7 @@ async def login(
         token_data = {
             "sub": user.username,
             "user_id": user.id,
-            "department_id": user.department_id if user.department_id else None,
+            "department_id": user.department_id,
             "department_name": department_name,
             "department_code": department_code,
             "roles": [role.name for role in user.roles],
@@ -109,6 +111,9 @@ async def login(
             expires_delta=access_token_expires
         )
         
+        # Prefetch the dashboard the client is about to request
+        dashboard_cache.schedule_warm(user.id)
+        
         return {"access_token": access_token, "token_type": "bearer"}
         
     except Exception as e:
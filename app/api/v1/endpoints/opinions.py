@@ -3,11 +3,11 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Body
 from fastapi.encoders import jsonable_encoder
 import json
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from openai import files
 from pydantic_core import ValidationError
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
 from typing import Dict, List, Optional
 from datetime import datetime
 import uuid
@@ -44,21 +44,103 @@ from app.schemas.opinion import (
     OpinionUpdate,
     OpinionReview,
     OpinionRequestWithDetails,
+    OpinionRequestList,
+    OpinionRequestListItem,
     DocumentInDB,
     RemarkInDB,
     SubCategoryBase,
-    WorkflowHistoryInDB,
     PriorityEnum,
     WorkflowStatusBase,
-    WorkflowStatusList
+    WorkflowStatusList,
+    document_list_adapter,
+    opinion_request_list_adapter
 )
 from app.models.opinion import Category, SubCategory
+from app.utils.dashboard_cache import dashboard_cache, build_user_dashboard
+from app.utils.file_storage import file_storage
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 
 router = APIRouter()
 
+# Scalar sub-selects used to inline related rows as JSON objects
+_USER_JSON = """(SELECT jsonb_build_object(
+        'id', u.id, 'username', u.username, 'email', u.email,
+        'is_active', COALESCE(u.is_active, true),
+        'is_superuser', COALESCE(u.is_superuser, false))
+    FROM users u WHERE u.id = {fk})"""
+_DEPARTMENT_JSON = """(SELECT jsonb_build_object(
+        'id', d.id, 'name', d.name, 'code', d.code,
+        'description', d.description, 'created_at', d.created_at)
+    FROM department d WHERE d.id = {fk})"""
+_STATUS_JSON = "(SELECT to_jsonb(s.*) FROM workflow_status s WHERE s.id = {fk})"
+_CATEGORY_JSON = "(SELECT to_jsonb(c.*) FROM categories c WHERE c.id = {fk})"
+
+# Whole OpinionRequestWithDetails tree in a single round-trip
+OPINION_REQUEST_DETAILS_SQL = f"""
+SELECT to_jsonb(r.*) || jsonb_build_object(
+    'requester', {_USER_JSON.format(fk='r.requester_id')},
+    'department', {_DEPARTMENT_JSON.format(fk='r.department_id')},
+    'current_status', {_STATUS_JSON.format(fk='r.current_status_id')},
+    'category_rel', {_CATEGORY_JSON.format(fk='r.category_id')},
+    'subcategory_rel', (
+        SELECT to_jsonb(sc.*) || jsonb_build_object('category', {_CATEGORY_JSON.format(fk='sc.category_id')})
+        FROM subcategories sc WHERE sc.id = r.sub_category_id
+    ),
+    'documents', COALESCE((
+        SELECT jsonb_agg(
+            to_jsonb(doc.*) || jsonb_build_object('uploader', {_USER_JSON.format(fk='doc.uploaded_by')})
+            ORDER BY doc.created_at DESC)
+        FROM documents doc WHERE doc.opinion_request_id = r.id
+    ), '[]'::jsonb),
+    'remarks', COALESCE((
+        SELECT jsonb_agg(
+            to_jsonb(rm.*) || jsonb_build_object('user', {_USER_JSON.format(fk='rm.user_id')})
+            ORDER BY rm.created_at DESC)
+        FROM remarks rm WHERE rm.opinion_request_id = r.id
+    ), '[]'::jsonb),
+    'opinions', COALESCE((
+        SELECT jsonb_agg(
+            to_jsonb(op.*) || jsonb_build_object(
+                'department', {_DEPARTMENT_JSON.format(fk='op.department_id')},
+                'expert', {_USER_JSON.format(fk='op.expert_id')},
+                'reviewer', {_USER_JSON.format(fk='op.reviewed_by')}))
+        FROM opinions op WHERE op.opinion_request_id = r.id
+    ), '[]'::jsonb),
+    'assignments', COALESCE((
+        SELECT jsonb_agg(
+            to_jsonb(a.*) || jsonb_build_object(
+                'department', {_DEPARTMENT_JSON.format(fk='a.department_id')},
+                'assigner', {_USER_JSON.format(fk='a.assigned_by')},
+                'expert', {_USER_JSON.format(fk='a.expert_id')},
+                'status', {_STATUS_JSON.format(fk='a.status_id')}))
+        FROM request_assignments a WHERE a.opinion_request_id = r.id
+    ), '[]'::jsonb),
+    'workflow_history', COALESCE((
+        SELECT jsonb_agg(
+            to_jsonb(wh.*) || jsonb_build_object(
+                'actor', {_USER_JSON.format(fk='wh.action_by')},
+                'from_status', {_STATUS_JSON.format(fk='wh.from_status_id')},
+                'to_status', {_STATUS_JSON.format(fk='wh.to_status_id')}))
+        FROM workflow_history wh WHERE wh.opinion_request_id = r.id
+    ), '[]'::jsonb),
+    'communications', COALESCE((
+        SELECT jsonb_agg(to_jsonb(ic.*))
+        FROM interdepartmental_communications ic WHERE ic.opinion_request_id = r.id
+    ), '[]'::jsonb)
+) AS details
+FROM opinion_requests r
+WHERE r.id = :request_id AND r.is_deleted = false
+"""
+
+def fetch_opinion_request_details(db: Session, request_id: int) -> Optional[dict]:
+    """Load an opinion request and all of its relations as one JSON document."""
+    return db.execute(
+        text(OPINION_REQUEST_DETAILS_SQL),
+        {"request_id": request_id}
+    ).scalar()
+
 @router.post("/requests/")
 async def create_opinion_request(
     *,
@@ -128,24 +210,20 @@ async def create_opinion_request(
         files = [f for f in files if f is not None]
         
         if files:
-            upload_dir = f"uploads/opinion_requests/{opinion_request.id}"
-            os.makedirs(upload_dir, exist_ok=True)
-
             for file in files:
-                safe_filename = f"{uuid.uuid4().hex}_{file.filename}"
-                file_path = os.path.join(upload_dir, safe_filename)
-
                 try:
-                    contents = await file.read()
-                    with open(file_path, "wb") as f:
-                        f.write(contents)
+                    file_path, safe_filename, file_size, file_type = await file_storage.save_file(
+                        file, opinion_request.id
+                    )
+                    if not file_path:
+                        continue
 
                     document = Document(
                         opinion_request_id=opinion_request.id,
                         file_name=file.filename,
                         file_path=file_path,
-                        file_type=file.content_type,
-                        file_size=len(contents),
+                        file_type=file_type,
+                        file_size=file_size,
                         file_url=f"/uploads/opinion_requests/{opinion_request.id}/{safe_filename}",
                         uploaded_by=current_user.id
                     )
@@ -169,6 +247,7 @@ async def create_opinion_request(
 
         db.commit()
         db.refresh(opinion_request)
+        dashboard_cache.invalidate_request(db, opinion_request)
 
         return opinion_request
 
@@ -184,6 +263,49 @@ async def create_opinion_request(
 
 
     
+def filter_opinion_requests(
+    db: Session,
+    status: Optional[str] = None,
+    department_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    sub_category_id: Optional[int] = None,
+    priority: Optional[PriorityEnum] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    has_attachments: Optional[bool] = None
+):
+    """Live opinion requests matching the list filters"""
+    query = db.query(OpinionRequest).filter(OpinionRequest.is_deleted == False)
+    
+    # Apply filters
+    if status:
+        query = query.join(WorkflowStatus).filter(WorkflowStatus.name == status)
+    
+    if department_id:
+        query = query.filter(OpinionRequest.department_id == department_id)
+        
+    if category_id:
+        query = query.filter(OpinionRequest.category_id == category_id)
+        
+    if sub_category_id:
+        query = query.filter(OpinionRequest.sub_category_id == sub_category_id)
+        
+    if priority:
+        query = query.filter(OpinionRequest.priority == priority)
+        
+    if from_date:
+        query = query.filter(OpinionRequest.created_at >= from_date)
+        
+    if to_date:
+        query = query.filter(OpinionRequest.created_at <= to_date)
+
+    # EXISTS instead of JOIN so LIMIT/OFFSET still count requests, not documents
+    if has_attachments is not None:
+        has_documents = OpinionRequest.documents.any()
+        query = query.filter(has_documents if has_attachments else ~has_documents)
+    
+    return query
+
 @router.get("/requests/", response_model=List[OpinionRequestWithDetails])
 async def get_opinion_requests(
     *,
@@ -197,32 +319,14 @@ async def get_opinion_requests(
     priority: Optional[PriorityEnum] = None,
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
+    has_attachments: Optional[bool] = None,
     current_user: User = Depends(get_current_active_user)
 ):
     try:
-        query = db.query(OpinionRequest).filter(OpinionRequest.is_deleted == False)
-        
-        # Apply filters
-        if status:
-            query = query.join(WorkflowStatus).filter(WorkflowStatus.name == status)
-        
-        if department_id:
-            query = query.filter(OpinionRequest.department_id == department_id)
-            
-        if category_id:
-            query = query.filter(OpinionRequest.category_id == category_id)
-            
-        if sub_category_id:
-            query = query.filter(OpinionRequest.sub_category_id == sub_category_id)
-            
-        if priority:
-            query = query.filter(OpinionRequest.priority == priority)
-            
-        if from_date:
-            query = query.filter(OpinionRequest.created_at >= from_date)
-            
-        if to_date:
-            query = query.filter(OpinionRequest.created_at <= to_date)
+        query = filter_opinion_requests(
+            db, status, department_id, category_id, sub_category_id,
+            priority, from_date, to_date, has_attachments
+        )
         
         # Get requests with related data
         requests = (
@@ -233,7 +337,8 @@ async def get_opinion_requests(
                 joinedload(OpinionRequest.requester),
                 joinedload(OpinionRequest.department),
                 joinedload(OpinionRequest.current_status),
-                joinedload(OpinionRequest.documents),
+                selectinload(OpinionRequest.documents)
+                    .selectinload(Document.uploader),
                 joinedload(OpinionRequest.remarks),
                 joinedload(OpinionRequest.opinions),
                 joinedload(OpinionRequest.assignments),
@@ -250,23 +355,80 @@ async def get_opinion_requests(
             .all()
         )
 
-        # Convert to Pydantic models
-        result = []
-        for request in requests:
-            request_dict = OpinionRequestWithDetails.from_orm(request)
-            # Ensure workflow_history is properly serialized
-            request_dict.workflow_history = [
-                WorkflowHistoryInDB.from_orm(history) 
-                for history in request.workflow_history
-            ]
-            result.append(request_dict)
-
-        return result
+        # Rows come straight from the DB, so skip per-field validation
+        items = [OpinionRequestWithDetails.from_orm_trusted(request) for request in requests]
+        return Response(
+            content=opinion_request_list_adapter.dump_json(items, by_alias=True),
+            media_type="application/json"
+        )
 
     except Exception as e:
         logging.error(f"Error fetching opinion requests: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/requests/summary/", response_model=OpinionRequestList)
+async def get_opinion_request_summaries(
+    *,
+    db: Session = Depends(get_db),
+    skip: int = 0,
+    limit: int = 20,
+    status: Optional[str] = None,
+    department_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    sub_category_id: Optional[int] = None,
+    priority: Optional[PriorityEnum] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    has_attachments: Optional[bool] = None,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Paginated list rows without relations or soft-delete bookkeeping"""
+    try:
+        query = filter_opinion_requests(
+            db, status, department_id, category_id, sub_category_id,
+            priority, from_date, to_date, has_attachments
+        )
+        total = query.count()
+        
+        # Only load the columns the list item carries
+        requests = (
+            query
+            .options(load_only(*(
+                getattr(OpinionRequest, name) for name in OpinionRequestListItem.model_fields
+            )))
+            .order_by(OpinionRequest.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        
+        return OpinionRequestList(
+            total=total,
+            items=[OpinionRequestListItem.from_orm_trusted(request) for request in requests]
+        )
+
+    except Exception as e:
+        logging.error(f"Error fetching opinion request summaries: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/dashboard")
+async def get_dashboard(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Pending assignments and open requests for the current user (cached for 60s)."""
+    try:
+        dashboard = dashboard_cache.get(current_user.id)
+        if dashboard is None:
+            generation = dashboard_cache.generation(current_user.id)
+            dashboard = build_user_dashboard(db, current_user.id)
+            dashboard_cache.set(current_user.id, dashboard, generation)
+        return dashboard
+
+    except Exception as e:
+        logging.error(f"Error fetching dashboard for user {current_user.id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/requests/{request_id}", response_model=OpinionRequestWithDetails)
 async def get_opinion_request(
     request_id: int,
@@ -275,31 +437,12 @@ async def get_opinion_request(
 ):
     """Get detailed information about a specific opinion request."""
     try:
-        request = (
-            db.query(OpinionRequest)
-            .filter(
-                OpinionRequest.id == request_id,
-                OpinionRequest.is_deleted == False
-            )
-            .options(
-                joinedload(OpinionRequest.category_rel),
-                joinedload(OpinionRequest.subcategory_rel),
-                joinedload(OpinionRequest.requester),
-                joinedload(OpinionRequest.department),
-                joinedload(OpinionRequest.current_status),
-                joinedload(OpinionRequest.documents),
-                joinedload(OpinionRequest.remarks),
-                joinedload(OpinionRequest.opinions),
-                joinedload(OpinionRequest.assignments),
-                joinedload(OpinionRequest.workflow_history)
-            )
-            .first()
-        )
+        details = fetch_opinion_request_details(db, request_id)
         
-        if not request:
+        if not details:
             raise HTTPException(status_code=404, detail="Opinion request not found")
         
-        return request
+        return OpinionRequestWithDetails.model_validate(details)
 
     except HTTPException:
         raise
@@ -377,6 +520,7 @@ async def update_opinion_request(
             
         db.commit()
         db.refresh(request)
+        dashboard_cache.invalidate_request(db, request)
         return request
 
     except HTTPException:
@@ -514,6 +658,7 @@ async def assign_request(
         
         # Refresh and return with all relationships loaded
         db.refresh(request)
+        dashboard_cache.invalidate_request(db, request)
         return request
     
     except HTTPException:
@@ -609,6 +754,8 @@ async def reassign_request(
         
         db.commit()
         db.refresh(request)
+        # The previous expert no longer has this assignment
+        dashboard_cache.invalidate_request(db, request, old_expert_id)
         return request
 
     except HTTPException:
@@ -673,24 +820,20 @@ async def create_opinion(
         
         # Handle file attachments if any
         if files:
-            upload_dir = f"uploads/opinion_requests/{request.id}/opinions/{opinion.id}"
-            os.makedirs(upload_dir, exist_ok=True)
-            
             for file in files:
                 try:
-                    safe_filename = f"{uuid.uuid4().hex}_{file.filename}"
-                    file_path = os.path.join(upload_dir, safe_filename)
-                    
-                    contents = await file.read()
-                    with open(file_path, "wb") as f:
-                        f.write(contents)
+                    file_path, safe_filename, file_size, file_type = await file_storage.save_file(
+                        file, request.id, opinion_id=opinion.id
+                    )
+                    if not file_path:
+                        continue
 
                     document = Document(
                         opinion_request_id=request.id,
                         file_name=file.filename,
                         file_path=file_path,
-                        file_type=file.content_type,
-                        file_size=len(contents),
+                        file_type=file_type,
+                        file_size=file_size,
                         file_url=f"/uploads/opinion_requests/{request.id}/opinions/{opinion.id}/{safe_filename}",
                         uploaded_by=current_user.id
                     )
@@ -742,6 +885,7 @@ async def create_opinion(
         
         db.commit()
         db.refresh(opinion)
+        dashboard_cache.invalidate_request(db, request)
         return opinion
         
     except HTTPException:
@@ -794,24 +938,20 @@ async def update_opinion(
         
         # Handle new files if any
         if files:
-            upload_dir = f"uploads/opinion_requests/{request.id}/opinions/{opinion.id}"
-            os.makedirs(upload_dir, exist_ok=True)
-            
             for file in files:
                 try:
-                    safe_filename = f"{uuid.uuid4().hex}_{file.filename}"
-                    file_path = os.path.join(upload_dir, safe_filename)
-                    
-                    contents = await file.read()
-                    with open(file_path, "wb") as f:
-                        f.write(contents)
+                    file_path, safe_filename, file_size, file_type = await file_storage.save_file(
+                        file, request.id, opinion_id=opinion.id
+                    )
+                    if not file_path:
+                        continue
 
                     document = Document(
                         opinion_request_id=request.id,
                         file_name=file.filename,
                         file_path=file_path,
-                        file_type=file.content_type,
-                        file_size=len(contents),
+                        file_type=file_type,
+                        file_size=file_size,
                         file_url=f"/uploads/opinion_requests/{request.id}/opinions/{opinion.id}/{safe_filename}",
                         uploaded_by=current_user.id
                     )
@@ -937,6 +1077,7 @@ async def submit_opinion(
         
         db.commit()
         db.refresh(opinion)
+        dashboard_cache.invalidate_request(db, request)
         return opinion
         
     except HTTPException:
@@ -975,11 +1116,9 @@ async def upload_documents(
 
         # Verify file types and sizes
         allowed_types = ['pdf', 'doc', 'docx', 'xls', 'xlsx']
-        max_file_size = 10 * 1024 * 1024  # 10MB
+        max_file_size_mb = 10
 
         uploaded_documents = []
-        upload_dir = f"uploads/opinion_requests/{request_id}"
-        os.makedirs(upload_dir, exist_ok=True)
 
         for file in files:
             try:
@@ -991,30 +1130,24 @@ async def upload_documents(
                         detail=f"File type .{file_ext} not allowed. Allowed types: {', '.join(allowed_types)}"
                     )
 
-                # Read file content
-                contents = await file.read()
-                
-                # Verify file size
-                if len(contents) > max_file_size:
+                # Stream to disk; save_file enforces the size limit as it copies
+                try:
+                    file_path, safe_filename, file_size, file_type = await file_storage.save_file(
+                        file, request_id, max_size_mb=max_file_size_mb
+                    )
+                except ValueError:
                     raise HTTPException(
                         status_code=400,
-                        detail=f"File {file.filename} exceeds maximum size of 10MB"
+                        detail=f"File {file.filename} exceeds maximum size of {max_file_size_mb}MB"
                     )
 
-                # Generate safe filename and save
-                safe_filename = f"{uuid.uuid4().hex}_{file.filename}"
-                file_path = os.path.join(upload_dir, safe_filename)
-                
-                with open(file_path, "wb") as file_object:
-                    file_object.write(contents)
-
                 # Create document record
                 document = Document(
                     opinion_request_id=request_id,
                     file_name=file.filename,
                     file_path=file_path,
-                    file_type=file.content_type,
-                    file_size=len(contents),
+                    file_type=file_type,
+                    file_size=file_size,
                     file_url=f"/uploads/opinion_requests/{request_id}/{safe_filename}",
                     uploaded_by=current_user.id,
                     created_at=datetime.utcnow()
@@ -1061,7 +1194,8 @@ async def upload_documents(
         db.add(history)
 
         db.commit()
-        return uploaded_documents
+        documents = document_list_adapter.validate_python(uploaded_documents)
+        return ORJSONResponse(content=document_list_adapter.dump_python(documents, mode='json'))
 
     except HTTPException:
         db.rollback()
@@ -1427,7 +1561,7 @@ async def get_categories(
         )
 
         # Convert to CategoryList format
-        return {
+        return ORJSONResponse(content={
             "total": total,
             "items": [
                 {
@@ -1446,7 +1580,7 @@ async def get_categories(
                 }
                 for cat in categories
             ]
-        }
+        })
 
     except Exception as e:
         logging.error(f"Error fetching categories: {e}")
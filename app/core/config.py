@@ -50,6 +50,6 @@ class Settings(BaseModel):
         'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     }
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
\ No newline at end of file
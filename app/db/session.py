@@ -1,8 +1,9 @@
 # app/db/session.py
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
+from contextlib import contextmanager
 from app.core.config import get_settings
 from urllib.parse import urlparse, urlunparse
 
@@ -51,6 +52,16 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
+@contextmanager
+def no_expire_on_commit(session: Session) -> Iterator[Session]:
+    """Keep loaded instances populated across commits inside the block"""
+    previous = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        yield session
+    finally:
+        session.expire_on_commit = previous
+
 # Keep existing get_db (maintain original naming)
 def get_db():
     db = SessionLocal()
@@ -1,6 +1,7 @@
 # app/initial_data.py
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from app.models.auth import User, Role, Permission
+from app.models.auth import User, Role, Permission, role_permissions, user_roles
 from app.models.department import Department
 from app.core.security import get_password_hash
 from app.models.opinion import (
@@ -10,6 +11,19 @@ from app.models.opinion import (
     SubCategory
 )
 
+# Rows per executemany INSERT
+BATCH_SIZE = 1000
+
+def _bulk_insert(db: Session, table, rows: list) -> None:
+    """Insert plain dict rows through Core executemany, bypassing the unit of work"""
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.execute(table.insert(), rows[start:start + BATCH_SIZE])
+
+def _release(db: Session, objects) -> None:
+    """Detach seeded rows the remaining seeders don't need"""
+    for obj in objects:
+        db.expunge(obj)
+
 def init_permissions(db: Session) -> dict:
     """Initialize default permissions"""
     permissions = {
@@ -48,13 +62,15 @@ def init_permissions(db: Session) -> dict:
         "manage_comments": "Can manage all comments"
     }
     
-    permission_objects = {}
-    for name, description in permissions.items():
-        db_permission = db.query(Permission).filter(Permission.name == name).first()
-        if not db_permission:
-            db_permission = Permission(name=name, description=description)
-            db.add(db_permission)
-        permission_objects[name] = db_permission
+    existing = {name for (name,) in db.query(Permission.name).filter(Permission.name.in_(permissions))}
+    _bulk_insert(db, Permission.__table__, [
+        {"name": name, "description": description}
+        for name, description in permissions.items() if name not in existing
+    ])
+    permission_objects = {
+        db_permission.name: db_permission
+        for db_permission in db.query(Permission).filter(Permission.name.in_(permissions))
+    }
     
     db.commit()
     return permission_objects
@@ -135,17 +151,23 @@ def init_roles(db: Session, permissions: dict) -> dict:
         }
     }
     
-    role_objects = {}
-    for name, data in roles.items():
-        db_role = db.query(Role).filter(Role.name == name).first()
-        if not db_role:
-            db_role = Role(
-                name=name,
-                description=data["description"]
-            )
-            db_role.permissions = data["permissions"]
-            db.add(db_role)
-        role_objects[name] = db_role
+    existing = {name for (name,) in db.query(Role.name).filter(Role.name.in_(roles))}
+    new_roles = [name for name in roles if name not in existing]
+    _bulk_insert(db, Role.__table__, [
+        {"name": name, "description": roles[name]["description"]}
+        for name in new_roles
+    ])
+    role_objects = {
+        db_role.name: db_role
+        for db_role in db.query(Role).filter(Role.name.in_(roles))
+    }
+    
+    # Only fresh roles get their permission links; existing roles keep what they have
+    _bulk_insert(db, role_permissions, [
+        {"role_id": role_objects[name].id, "permission_id": permission.id}
+        for name in new_roles
+        for permission in roles[name]["permissions"]
+    ])
     
     db.commit()
     return role_objects
@@ -232,13 +254,14 @@ def init_departments(db: Session) -> dict:
         }
     }
     
-    department_objects = {}
-    for code, data in departments.items():
-        db_dept = db.query(Department).filter(Department.code == code).first()
-        if not db_dept:
-            db_dept = Department(**data)
-            db.add(db_dept)
-        department_objects[code] = db_dept
+    existing = {code for (code,) in db.query(Department.code).filter(Department.code.in_(departments))}
+    _bulk_insert(db, Department.__table__, [
+        data for code, data in departments.items() if code not in existing
+    ])
+    department_objects = {
+        db_dept.code: db_dept
+        for db_dept in db.query(Department).filter(Department.code.in_(departments))
+    }
     
     db.commit()
     return department_objects
@@ -359,19 +382,27 @@ def init_default_users(db: Session, roles: dict, departments: dict):
         }
     ]
     
-    for user_data in users:
-        db_user = db.query(User).filter(User.email == user_data["email"]).first()
-        if not db_user:
-            is_superuser = user_data.get("is_superuser", False)
-            db_user = User(
-                email=user_data["email"],
-                username=user_data["username"],
-                hashed_password=get_password_hash(user_data["password"]),
-                is_superuser=is_superuser,
-                department_id=user_data["department"].id
-            )
-            db_user.roles = [user_data["role"]]
-            db.add(db_user)
+    emails = [user_data["email"] for user_data in users]
+    existing = {email for (email,) in db.query(User.email).filter(User.email.in_(emails))}
+    new_users = [user_data for user_data in users if user_data["email"] not in existing]
+    _bulk_insert(db, User.__table__, [
+        {
+            "email": user_data["email"],
+            "username": user_data["username"],
+            "hashed_password": get_password_hash(user_data["password"]),
+            "is_superuser": user_data.get("is_superuser", False),
+            "department_id": user_data["department"].id
+        }
+        for user_data in new_users
+    ])
+    
+    user_ids = dict(
+        db.query(User.email, User.id).filter(User.email.in_([u["email"] for u in new_users]))
+    )
+    _bulk_insert(db, user_roles, [
+        {"user_id": user_ids[user_data["email"]], "role_id": user_data["role"].id}
+        for user_data in new_users
+    ])
     
     db.commit()
     
@@ -392,18 +423,17 @@ def init_workflow_statuses(db: Session) -> dict:
         "rejected": "Request rejected"
     }
     
-    status_objects = {}
-    for name, description in statuses.items():
-        db_status = db.query(WorkflowStatus).filter(
-            WorkflowStatus.name == name
-        ).first()
-        if not db_status:
-            db_status = WorkflowStatus(
-                name=name,
-                description=description
-            )
-            db.add(db_status)
-        status_objects[name] = db_status
+    existing = {
+        name for (name,) in db.query(WorkflowStatus.name).filter(WorkflowStatus.name.in_(statuses))
+    }
+    _bulk_insert(db, WorkflowStatus.__table__, [
+        {"name": name, "description": description}
+        for name, description in statuses.items() if name not in existing
+    ])
+    status_objects = {
+        db_status.name: db_status
+        for db_status in db.query(WorkflowStatus).filter(WorkflowStatus.name.in_(statuses))
+    }
     
     db.commit()
     return status_objects
@@ -449,15 +479,18 @@ def init_communication_types(db: Session) -> dict:
         }
     }
     
-    type_objects = {}
-    for code, data in types.items():
-        db_type = db.query(CommunicationType).filter(
-            CommunicationType.name == data["name"]
-        ).first()
-        if not db_type:
-            db_type = CommunicationType(**data)
-            db.add(db_type)
-        type_objects[code] = db_type
+    names = [data["name"] for data in types.values()]
+    existing = {
+        name for (name,) in db.query(CommunicationType.name).filter(CommunicationType.name.in_(names))
+    }
+    _bulk_insert(db, CommunicationType.__table__, [
+        data for data in types.values() if data["name"] not in existing
+    ])
+    by_name = {
+        db_type.name: db_type
+        for db_type in db.query(CommunicationType).filter(CommunicationType.name.in_(names))
+    }
+    type_objects = {code: by_name[data["name"]] for code, data in types.items()}
     
     db.commit()
     return type_objects
@@ -485,11 +518,16 @@ def add_opinion_permissions(db: Session, permissions: dict):
         "export_opinion_reports": "Can export opinion reports"
     }
     
-    for name, description in opinion_permissions.items():
-        if name not in permissions:
-            db_permission = Permission(name=name, description=description)
-            db.add(db_permission)
-            permissions[name] = db_permission
+    names = [name for name in opinion_permissions if name not in permissions]
+    existing = {name for (name,) in db.query(Permission.name).filter(Permission.name.in_(names))}
+    _bulk_insert(db, Permission.__table__, [
+        {"name": name, "description": opinion_permissions[name]}
+        for name in names if name not in existing
+    ])
+    permissions.update(
+        (db_permission.name, db_permission)
+        for db_permission in db.query(Permission).filter(Permission.name.in_(names))
+    )
     
     db.commit()
     return permissions
@@ -539,39 +577,43 @@ def init_categories_and_subcategories(db: Session) -> dict:
         "Reports and Studies": []
     }
     
-    category_objects = {}
+    # Create categories first so subcategory rows have their IDs
+    existing = {name for (name,) in db.query(Category.name).filter(Category.name.in_(categories_data))}
+    _bulk_insert(db, Category.__table__, [
+        {"name": name} for name in categories_data if name not in existing
+    ])
+    db_categories = {
+        db_category.name: db_category
+        for db_category in db.query(Category).filter(Category.name.in_(categories_data))
+    }
+    category_ids = [db_category.id for db_category in db_categories.values()]
     
-    for category_name, subcategories in categories_data.items():
-        # Create or get category
-        db_category = db.query(Category).filter(
-            Category.name == category_name
-        ).first()
-        
-        if not db_category:
-            db_category = Category(name=category_name)
-            db.add(db_category)
-            db.flush()  # Get ID for subcategories
-            
-        category_objects[category_name] = {
-            "category": db_category,
-            "subcategories": []
+    existing_subcategories = set(
+        db.query(SubCategory.category_id, SubCategory.name).filter(
+            SubCategory.category_id.in_(category_ids)
+        )
+    )
+    _bulk_insert(db, SubCategory.__table__, [
+        {"category_id": db_categories[category_name].id, "name": subcategory_name}
+        for category_name, subcategories in categories_data.items()
+        for subcategory_name in subcategories
+        if (db_categories[category_name].id, subcategory_name) not in existing_subcategories
+    ])
+    db_subcategories = {
+        (db_subcategory.category_id, db_subcategory.name): db_subcategory
+        for db_subcategory in db.query(SubCategory).filter(SubCategory.category_id.in_(category_ids))
+    }
+    
+    category_objects = {
+        category_name: {
+            "category": db_categories[category_name],
+            "subcategories": [
+                db_subcategories[(db_categories[category_name].id, subcategory_name)]
+                for subcategory_name in subcategories
+            ]
         }
-        
-        # Create subcategories
-        for subcategory_name in subcategories:
-            db_subcategory = db.query(SubCategory).filter(
-                SubCategory.category_id == db_category.id,
-                SubCategory.name == subcategory_name
-            ).first()
-            
-            if not db_subcategory:
-                db_subcategory = SubCategory(
-                    category_id=db_category.id,
-                    name=subcategory_name
-                )
-                db.add(db_subcategory)
-            
-            category_objects[category_name]["subcategories"].append(db_subcategory)
+        for category_name, subcategories in categories_data.items()
+    }
     
     db.commit()
     return category_objects
@@ -580,9 +622,8 @@ def init_categories_and_subcategories(db: Session) -> dict:
 def init_db(db: Session) -> None:
     """Initialize database with default data"""
     try:
-        # Check if database is already initialized
-        existing_users = db.query(User).first()
-        if existing_users:
+        # Check if database is already initialized (EXISTS, no row is loaded)
+        if db.query(db.query(User.id).exists()).scalar():
             print("Database already contains data. Skipping initialization.")
             return
 
@@ -600,17 +641,26 @@ def init_db(db: Session) -> None:
         print("Initializing departments...")
         departments = init_departments(db)
         
-        print("Initializing categories and subcategories...")  # Add this line
-        categories = init_categories_and_subcategories(db)     # Add this line
+        # Each seeder commits its own entity type, so a failure only loses the group
+        # in flight; these groups are independent, so stop tracking their rows
+        print("Initializing categories and subcategories...")
+        categories = init_categories_and_subcategories(db)
+        _release(db, [
+            obj
+            for group in categories.values()
+            for obj in (group["category"], *group["subcategories"])
+        ])
         
         print("Initializing workflow statuses...")
-        workflow_statuses = init_workflow_statuses(db)
+        _release(db, init_workflow_statuses(db).values())
         
         print("Initializing communication types...")
-        communication_types = init_communication_types(db)
+        _release(db, init_communication_types(db).values())
         
+        # Users last: their presence is what marks the database as initialized
         print("Initializing default users...")
         init_default_users(db, roles, departments)
+        db.expunge_all()
         
         print("Database initialization completed successfully!")
         
@@ -625,16 +675,17 @@ def init_db(db: Session) -> None:
 def check_init_status(db: Session) -> dict:
     """Check the initialization status of the database"""
     try:
+        # Plain COUNT(*) per table; Query.count() would wrap each in a full-row subquery
         status = {
-            "permissions": db.query(Permission).count(),
-            "roles": db.query(Role).count(),
-            "departments": db.query(Department).count(),
-            "users": db.query(User).count(),
-            "superusers": db.query(User).filter(User.is_superuser == True).count(),
-            "workflow_statuses": db.query(WorkflowStatus).count(),
-            "communication_types": db.query(CommunicationType).count(),
-            "categories": db.query(Category).count(),           # Add this line
-            "subcategories": db.query(SubCategory).count()     # Add this line
+            "permissions": db.query(func.count(Permission.id)).scalar(),
+            "roles": db.query(func.count(Role.id)).scalar(),
+            "departments": db.query(func.count(Department.id)).scalar(),
+            "users": db.query(func.count(User.id)).scalar(),
+            "superusers": db.query(func.count(User.id)).filter(User.is_superuser == True).scalar(),
+            "workflow_statuses": db.query(func.count(WorkflowStatus.id)).scalar(),
+            "communication_types": db.query(func.count(CommunicationType.id)).scalar(),
+            "categories": db.query(func.count(Category.id)).scalar(),
+            "subcategories": db.query(func.count(SubCategory.id)).scalar()
         }
         return status
     except Exception as e:
@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.core.config import get_settings
@@ -14,6 +15,7 @@ from datetime import datetime
 import uvicorn
 from fastapi_socketio import SocketManager
 from app.api.v1.endpoints.chat import register_socket_events, get_chat_router
+from app.schemas.opinion import OpinionRequestInDB, OpinionRequestWithDetails, OpinionRequestList
 import logging
 
 
@@ -27,6 +29,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     description="API for streamlining Abu Dhabi government services",
     version=settings.VERSION,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS before SocketManager
@@ -55,6 +58,10 @@ app.include_router(documentprocessor.router, prefix="/api/v1/documentprocessor",
 app.include_router(opinions.router, prefix="/api/v1/opinions", tags=["Opinion Management"])
 app.include_router(searchanalysis.router, prefix="/api/v1/searchanalysis", tags=["Search Analysis"])
 
+# Opinion schemas defer their build; warm the hot response models at boot
+for schema in (OpinionRequestInDB, OpinionRequestWithDetails, OpinionRequestList):
+    schema.model_rebuild(force=True)
+
 
 # Initialize SocketManager after routes are set up
 sio = SocketManager(
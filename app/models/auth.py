@@ -29,6 +29,7 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     department_id = Column(Integer, ForeignKey('department.id'), nullable=True)    
+    opinion_request_count = Column(Integer, server_default='0', nullable=False)  # Maintained by DB trigger on opinion_requests
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -1,6 +1,6 @@
 from typing import List, Optional, ForwardRef, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, AliasChoices
 from app.schemas.base import UserBase, DepartmentBase
 
 Role = ForwardRef('Role')
@@ -133,7 +133,10 @@ class UserSearchParams(BaseModel):
 
 # Extended Response Models
 class UserDetail(User):
-    total_opinions: int = 0
+    # Read straight from the trigger-maintained users.opinion_request_count column
+    total_opinions: int = Field(
+        0, validation_alias=AliasChoices('opinion_request_count', 'total_opinions')
+    )
     total_assignments: int = 0
     recent_activities: List[Dict[str, Any]] = []
 
@@ -1,7 +1,52 @@
 # app/schemas/base.py
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, EmailStr, RootModel
+from typing import Optional, List, Dict, Any, Union, get_args, get_origin
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _enum_members(enum_cls: type) -> Dict[Any, Enum]:
+    """Value -> member map, built once per Enum class"""
+    return {member.value: member for member in enum_cls}
+
+def _construct_trusted(annotation: Any, value: Any) -> Any:
+    """Coerce a trusted ORM value into the shape of a field annotation without validating"""
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        origin = get_origin(annotation)
+    if origin in (list, List):
+        item_type = get_args(annotation)[0]
+        return [_construct_trusted(item_type, item) for item in value]
+    if isinstance(annotation, type):
+        if issubclass(annotation, RootModel):
+            return annotation.model_construct(value)
+        if issubclass(annotation, BaseModel):
+            return construct_from_orm(annotation, value)
+        if issubclass(annotation, Enum) and not isinstance(value, annotation):
+            member = _enum_members(annotation).get(value)
+            return member if member is not None else annotation(value)
+    return value
+
+def construct_from_orm(model: type, obj: Any) -> BaseModel:
+    """Build a schema from a trusted ORM row via model_construct, leaves first"""
+    values = {}
+    for name, field in model.model_fields.items():
+        value = getattr(obj, name, field)
+        if value is field:
+            continue
+        values[name] = _construct_trusted(field.annotation, value)
+    # Only the attributes found on the row count as set, same as from_attributes
+    return model.model_construct(_fields_set=set(values), **values)
+
+class TrustedORMMixin:
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """Skip validation for rows that come straight from the database"""
+        return construct_from_orm(cls, obj)
 
 class TimestampedBase(BaseModel):
     created_at: datetime
@@ -1,15 +1,17 @@
 #app/schemas/opinion.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, RootModel, TypeAdapter
 from fastapi import Form
 from datetime import datetime
-from typing import Optional, List, Dict, Any, ForwardRef
+from typing import Optional, List, Dict, Literal, Union
 from enum import Enum
-from app.schemas.base import UserBase, DepartmentBase
+from app.schemas.base import UserBase, DepartmentBase, TrustedORMMixin
 
 User = UserBase
 Department = DepartmentBase
-OpinionRequestInDB = ForwardRef('OpinionRequestInDB')
-WorkflowStatusInDB = ForwardRef('WorkflowStatusInDB')
+
+# Schemas build on first use instead of at import
+class _Base(BaseModel):
+    model_config = ConfigDict(defer_build=True, from_attributes=True, populate_by_name=True)
 
 class PriorityEnum(str, Enum):
     low = "low"
@@ -17,6 +19,9 @@ class PriorityEnum(str, Enum):
     high = "high"
     urgent = "urgent"
 
+# Schemas validate priority as a plain string set; PriorityEnum stays for docs and query params
+Priority = Literal['low', 'medium', 'high', 'urgent']
+
 class OpinionStatusEnum(str, Enum):
     draft = "draft"
     submitted = "submitted"
@@ -32,21 +37,27 @@ class CommunicationStatusEnum(str, Enum):
     cancelled = "cancelled"
 
 # Base Schemas
-class WorkflowStatusBase(BaseModel):
+class WorkflowStatusBase(_Base):
+    id: int
     name: str
     description: Optional[str] = None
+    created_at: datetime
 
-class CategoryBase(BaseModel):
+class CategoryBase(_Base):
+    id: int
     name: str
+    created_at: datetime
 
-class SubCategoryBase(BaseModel):
+class SubCategoryBase(_Base):
+    id: int
     name: str
     category_id: int
+    created_at: datetime
 
-class OpinionRequestBase(BaseModel):
+class OpinionRequestBase(_Base):
     title: str
     description: str
-    priority: PriorityEnum
+    priority: Priority
     due_date: Optional[datetime] = None
     category_id: int
     sub_category_id: Optional[int] = None
@@ -62,39 +73,50 @@ class OpinionRequestBase(BaseModel):
     work_plan: Optional[str] = None
     decision_draft: Optional[str] = None
 
-class DocumentBase(BaseModel):
+class DocumentBase(_Base):
     file_name: str
     file_path: str
     file_type: Optional[str] = None
     file_size: Optional[int] = None
     file_url: Optional[str] = None
 
-class RemarkBase(BaseModel):
+class RemarkBase(_Base):
     content: str
 
-class OpinionBase(BaseModel):
+class OpinionBase(_Base):
     content: str
     recommendation: Optional[str] = None
 
-class RequestAssignmentBase(BaseModel):
+class RequestAssignmentBase(_Base):
     department_id: int
     expert_id: int
     due_date: Optional[datetime] = None
     is_primary: bool = False
 
-class CommunicationTypeBase(BaseModel):
+class CommunicationTypeBase(_Base):
     name: str
     description: Optional[str] = None
     requires_response: bool = False
     default_deadline_hours: Optional[int] = None
 
-class InterdepartmentalCommunicationBase(BaseModel):
+class InterdepartmentalCommunicationBase(_Base):
     subject: str
     content: str
-    priority: PriorityEnum = PriorityEnum.medium
+    priority: Priority = 'medium'
     due_date: Optional[datetime] = None
 
 # Create Schemas
+class WorkflowStatusCreate(_Base):
+    name: str
+    description: Optional[str] = None
+
+class CategoryCreate(_Base):
+    name: str
+
+class SubCategoryCreate(_Base):
+    name: str
+    category_id: int
+
 class OpinionRequestCreate(OpinionRequestBase):
     department_id: int
 
@@ -123,7 +145,7 @@ class OpinionRequestCreate(OpinionRequestBase):
         return cls(
             title=title,
             description=description,
-            priority=priority,
+            priority=priority.value,
             department_id=department_id,
             category_id=category_id,
             sub_category_id=sub_category_id,
@@ -168,10 +190,10 @@ class InterdepartmentalCommunicationCreate(InterdepartmentalCommunicationBase):
     parent_communication_id: Optional[int] = None
 
 # Update Schemas
-class OpinionRequestUpdate(BaseModel):
+class OpinionRequestUpdate(_Base):
     title: Optional[str] = None
     description: Optional[str] = None
-    priority: Optional[PriorityEnum] = None
+    priority: Optional[Priority] = None
     due_date: Optional[datetime] = None
     request_statement: Optional[str] = None
     challenges_opportunities: Optional[str] = None
@@ -185,56 +207,38 @@ class OpinionRequestUpdate(BaseModel):
     work_plan: Optional[str] = None
     decision_draft: Optional[str] = None
 
-class OpinionUpdate(BaseModel):
+class OpinionUpdate(_Base):
     content: Optional[str] = None
     recommendation: Optional[str] = None
     status: Optional[OpinionStatusEnum] = None
     review_comments: Optional[str] = None
 
 # Response Schemas
-class WorkflowStatusInDB(WorkflowStatusBase):
-    id: int
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-class CategoryInDB(CategoryBase):
-    id: int
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
+WorkflowStatusInDB = WorkflowStatusBase
+CategoryInDB = CategoryBase
 
 class SubCategoryInDB(SubCategoryBase):
-    id: int
-    created_at: datetime
     category: CategoryInDB
 
-    class Config:
-        from_attributes = True
-
-class DocumentInDB(DocumentBase):
+class DocumentInDB(DocumentBase, TrustedORMMixin):
     id: int
     opinion_request_id: int
     uploaded_by: int
     created_at: datetime
     uploader: Optional[User] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
-class RemarkInDB(RemarkBase):
+class RemarkInDB(RemarkBase, TrustedORMMixin):
     id: int
     opinion_request_id: int
     user_id: int
     created_at: datetime
     user: Optional[User] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
-class OpinionInDB(OpinionBase):
+class OpinionInDB(OpinionBase, TrustedORMMixin):
     id: int
     opinion_request_id: int
     department_id: int
@@ -248,11 +252,10 @@ class OpinionInDB(OpinionBase):
     expert: Optional[User] = None
     reviewer: Optional[User] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
 
-class RequestAssignmentInDB(RequestAssignmentBase):
+class RequestAssignmentInDB(RequestAssignmentBase, TrustedORMMixin):
     id: int
     opinion_request_id: int
     assigned_by: int
@@ -263,40 +266,15 @@ class RequestAssignmentInDB(RequestAssignmentBase):
     expert: Optional[User] = None
     status: Optional[WorkflowStatusInDB] = None
 
-    class Config:
-        from_attributes = True
-
-class OpinionRequestInDB(OpinionRequestBase):
-    id: int
-    reference_number: str
-    requester_id: int
-    department_id: int
-    current_status_id: int
-    created_at: datetime
-    updated_at: datetime
-    version: int
-    is_deleted: bool
-    deleted_at: Optional[datetime]
-    deleted_by: Optional[int]
-    
-    documents: List[DocumentInDB] = []
-    remarks: List[RemarkInDB] = []
-    opinions: List[OpinionInDB] = []
-    assignments: List[RequestAssignmentInDB] = []
-    category_rel: Optional[CategoryInDB] = None
-    subcategory_rel: Optional[SubCategoryInDB] = None
-    requester: Optional[User] = None
-    department: Optional[Department] = None
-    current_status: Optional[WorkflowStatusInDB] = None
+    model_config = ConfigDict(frozen=True)
 
-    class Config:
-        from_attributes = True
-        
-# In app/schemas/opinion.py, add:
+# Flat audit payloads written by the workflow endpoints
+class ActionDetails(RootModel[Dict[str, Union[str, int, float, bool, List[str], None]]]):
+    pass
 
-class WorkflowHistoryBase(BaseModel):
+class WorkflowHistoryBase(_Base):
     action_type: str
-    action_details: Optional[Dict[str, Any]] = None
+    action_details: Optional[ActionDetails] = None
 
 class WorkflowHistoryCreate(WorkflowHistoryBase):
     opinion_request_id: int
@@ -304,7 +282,7 @@ class WorkflowHistoryCreate(WorkflowHistoryBase):
     from_status_id: Optional[int] = None
     to_status_id: Optional[int] = None
 
-class WorkflowHistoryInDB(WorkflowHistoryBase):
+class WorkflowHistoryInDB(WorkflowHistoryBase, TrustedORMMixin):
     id: int
     opinion_request_id: int
     action_by: int
@@ -312,88 +290,91 @@ class WorkflowHistoryInDB(WorkflowHistoryBase):
     to_status_id: Optional[int]
     created_at: datetime
     action_type: str
-    action_details: Optional[Dict[str, Any]] = None
+    action_details: Optional[ActionDetails] = None
     
     # Include these relations with proper typing
     actor: Optional[UserBase] = None
     from_status: Optional[WorkflowStatusInDB] = None
     to_status: Optional[WorkflowStatusInDB] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
+
+# Whole-list validator: one pydantic-core call per list instead of one per row
+document_list_adapter = TypeAdapter(List[DocumentInDB])
+
+class CommunicationSummary(_Base, TrustedORMMixin):
+    id: int
+    subject: str
+    from_department_id: Optional[int] = None
+    to_department_id: Optional[int] = None
+    status: Optional[str] = None
+    created_at: datetime
 
+class OpinionRequestInDB(OpinionRequestBase, TrustedORMMixin):
+    id: int
+    reference_number: str
+    requester_id: int
+    department_id: int
+    current_status_id: int
+    created_at: datetime
+    updated_at: datetime
+    version: int
+    is_deleted: bool
+    deleted_at: Optional[datetime]
+    deleted_by: Optional[int]
+    
+    documents: List[DocumentInDB] = []
+    remarks: List[RemarkInDB] = []
+    opinions: List[OpinionInDB] = []
+    assignments: List[RequestAssignmentInDB] = []
+    category_rel: Optional[CategoryInDB] = None
+    subcategory_rel: Optional[SubCategoryInDB] = None
+    requester: Optional[User] = None
+    department: Optional[Department] = None
+    current_status: Optional[WorkflowStatusInDB] = None
+
+    model_config = ConfigDict(frozen=True)
+        
 # Additional Schemas
 class OpinionRequestWithDetails(OpinionRequestInDB):
     # Explicitly type workflow_history as a list of WorkflowHistoryInDB
     workflow_history: List[WorkflowHistoryInDB] = []
-    communications: List[Dict[str, Any]] = []
+    communications: List[CommunicationSummary] = []
 
-    class Config:
-        from_attributes = True
+# Serializes the GET /requests/ payload straight to JSON bytes, with no intermediate dicts
+opinion_request_list_adapter = TypeAdapter(List[OpinionRequestWithDetails])
 
-class OpinionReview(BaseModel):
+class OpinionReview(_Base):
     is_approved: bool
     comments: Optional[str] = None
 
-class OpinionRequestList(BaseModel):
-    total: int
-    items: List[OpinionRequestInDB]
-
-    class Config:
-        from_attributes = True
-        
-# In app/schemas/opinion.py
-
-class WorkflowStatusBase(BaseModel):
-    name: str
-    description: Optional[str] = None
+# Slim row for list views; soft-delete bookkeeping and relations stay on OpinionRequestInDB
+class OpinionRequestListItem(_Base, TrustedORMMixin):
+    id: int
+    reference_number: str
+    title: str
+    priority: Priority
+    due_date: Optional[datetime] = None
+    requester_id: int
+    department_id: int
+    current_status_id: Optional[int] = None
     created_at: datetime
+    category_id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True)
 
-class WorkflowStatusList(BaseModel):
+class OpinionRequestList(_Base):
     total: int
-    items: List[WorkflowStatusBase]
+    items: List[OpinionRequestListItem]
 
-    class Config:
-        from_attributes = True
+class WorkflowStatusList(_Base):
+    total: int
+    items: List[WorkflowStatusBase]
 
 # Category Schemas
-class SubCategoryBase(BaseModel):
-    id: int
-    name: str
-    category_id: int
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-class CategoryBase(BaseModel):
-    id: int
-    name: str
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
 class CategoryWithSubcategories(CategoryBase):
     subcategories: List[SubCategoryBase] = []
 
-    class Config:
-        from_attributes = True
-
-class CategoryList(BaseModel):
+class CategoryList(_Base):
     total: int
     items: List[CategoryWithSubcategories]
-
-    class Config:
-        from_attributes = True
-
-OpinionInDB.model_rebuild()
-DocumentInDB.model_rebuild()
-RemarkInDB.model_rebuild()
-RequestAssignmentInDB.model_rebuild()
-WorkflowHistoryInDB.model_rebuild()
-OpinionRequestInDB.model_rebuild()
-OpinionRequestWithDetails.model_rebuild()
\ No newline at end of file
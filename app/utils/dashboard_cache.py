@@ -0,0 +1,126 @@
+# app/utils/dashboard_cache.py
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.opinion import OpinionRequest, RequestAssignment, WorkflowStatus
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_TTL_SECONDS = 60
+CLOSED_STATUSES = ('head_approved', 'completed', 'rejected')
+
+class DashboardCache:
+    def __init__(self, ttl: int = DASHBOARD_TTL_SECONDS, maxsize: int = 10000):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._tasks: Set[asyncio.Task] = set()
+        # Bumped by invalidate(); a dashboard built before the bump is stale
+        self._generations: Dict[int, int] = {}
+
+    @staticmethod
+    def key(user_id: int) -> str:
+        return f"user:{user_id}:dashboard"
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached dashboard for a user, if still fresh"""
+        return self._cache.get(self.key(user_id))
+
+    def generation(self, user_id: int) -> int:
+        """Capture before building a dashboard and pass to set()"""
+        return self._generations.get(user_id, 0)
+
+    def set(self, user_id: int, data: Dict[str, Any], generation: Optional[int] = None) -> None:
+        """Cache a dashboard, unless it was invalidated since `generation` was captured"""
+        if generation is not None and generation != self.generation(user_id):
+            return
+        self._cache[self.key(user_id)] = data
+
+    def invalidate(self, user_id: int) -> None:
+        self._generations[user_id] = self.generation(user_id) + 1
+        self._cache.pop(self.key(user_id), None)
+
+    def invalidate_request(self, db: Session, opinion_request: OpinionRequest, *user_ids: Optional[int]) -> None:
+        """Drop every dashboard a request shows up on: its requester's, its assignees' and any extras"""
+        expert_ids = db.query(RequestAssignment.expert_id).filter(
+            RequestAssignment.opinion_request_id == opinion_request.id
+        )
+        affected = {opinion_request.requester_id, *user_ids, *(expert_id for (expert_id,) in expert_ids)}
+        for user_id in affected:
+            if user_id is not None:
+                self.invalidate(user_id)
+
+    async def warm(self, user_id: int) -> None:
+        """Load a user's dashboard off the event loop and cache it"""
+        try:
+            generation = self.generation(user_id)
+            data = await asyncio.to_thread(_load_user_dashboard, user_id)
+            # A write may have invalidated this user while the thread was loading
+            self.set(user_id, data, generation)
+        except Exception as e:
+            logger.error(f"Error warming dashboard cache for user {user_id}: {e}")
+
+    def schedule_warm(self, user_id: int) -> None:
+        """Fire-and-forget warm-up; keeps a reference so the task isn't GC'd"""
+        task = asyncio.create_task(self.warm(user_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+def build_user_dashboard(db: Session, user_id: int) -> Dict[str, Any]:
+    """Pending assignments and open requests for a user"""
+    open_status_ids = select(WorkflowStatus.id).where(WorkflowStatus.name.not_in(CLOSED_STATUSES))
+
+    assignments = (
+        db.query(
+            RequestAssignment.id,
+            RequestAssignment.opinion_request_id,
+            RequestAssignment.department_id,
+            RequestAssignment.status_id,
+            RequestAssignment.due_date,
+            RequestAssignment.is_primary,
+        )
+        .filter(
+            RequestAssignment.expert_id == user_id,
+            RequestAssignment.status_id.in_(open_status_ids)
+        )
+        .order_by(RequestAssignment.due_date)
+        .all()
+    )
+
+    requests = (
+        db.query(
+            OpinionRequest.id,
+            OpinionRequest.reference_number,
+            OpinionRequest.title,
+            OpinionRequest.priority,
+            OpinionRequest.current_status_id,
+            OpinionRequest.due_date,
+            OpinionRequest.created_at,
+        )
+        .filter(
+            OpinionRequest.requester_id == user_id,
+            OpinionRequest.is_deleted == False,
+            OpinionRequest.current_status_id.in_(open_status_ids)
+        )
+        .order_by(OpinionRequest.created_at.desc())
+        .all()
+    )
+
+    return {
+        "assignments": [dict(row._mapping) for row in assignments],
+        "requests": [dict(row._mapping) for row in requests],
+    }
+
+def _load_user_dashboard(user_id: int) -> Dict[str, Any]:
+    db = SessionLocal()
+    try:
+        return build_user_dashboard(db, user_id)
+    finally:
+        db.close()
+
+# Initialize dashboard cache
+dashboard_cache = DashboardCache()
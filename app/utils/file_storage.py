@@ -1,15 +1,28 @@
 # app/utils/file_storage.py
 
+import asyncio
+import functools
+import mimetypes
 import os
-from typing import Optional
+import secrets
+from typing import BinaryIO, Optional
 from fastapi import UploadFile
-import uuid
 import shutil
 
+CHUNK_SIZE = 1 << 20
+
+# Extension -> MIME table, loaded once at import
+_MIME = mimetypes.MimeTypes([path for path in mimetypes.knownfiles if os.path.isfile(path)])
+# Office formats accepted by the upload endpoints; not in Python's built-in table
+_MIME.add_type("application/vnd.openxmlformats-officedocument.wordprocessingml.document", ".docx")
+_MIME.add_type("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx")
+
 class FileStorage:
     def __init__(self, base_upload_dir: str = "uploads"):
         self.base_upload_dir = base_upload_dir
         self.ensure_base_directory()
+        # Request dirs only need creating once per process
+        self._ensure_request_dir = functools.lru_cache(maxsize=8192)(self._create_request_dir)
     
     def ensure_base_directory(self):
         """Ensure base upload directory exists"""
@@ -18,42 +31,80 @@ class FileStorage:
     
     def get_opinion_request_dir(self, request_id: int) -> str:
         """Get directory for opinion request files"""
+        return self._ensure_request_dir(request_id)
+
+    def get_opinion_dir(self, request_id: int, opinion_id: int) -> str:
+        """Get directory for files attached to an opinion"""
+        opinion_dir = os.path.join(self.get_opinion_request_dir(request_id), 'opinions', str(opinion_id))
+        os.makedirs(opinion_dir, exist_ok=True)
+        return opinion_dir
+
+    def _create_request_dir(self, request_id: int) -> str:
         request_dir = os.path.join(self.base_upload_dir, 'opinion_requests', str(request_id))
         os.makedirs(request_dir, exist_ok=True)
         return request_dir
     
+    def guess_file_type(self, file: UploadFile) -> Optional[str]:
+        """MIME type from the filename extension, falling back to what the client sent"""
+        file_type, _ = _MIME.guess_type(file.filename or "")
+        return file_type or file.content_type
+
     async def save_file(
         self,
         file: UploadFile,
         request_id: int,
-        max_size_mb: int = 10
-    ) -> tuple[str, str, int]:
+        max_size_mb: int = 10,
+        opinion_id: Optional[int] = None
+    ) -> tuple[str, str, int, Optional[str]]:
         """
-        Save uploaded file and return path, filename and size
+        Save uploaded file and return path, filename, size and MIME type
         """
         if not file.filename:
-            return None, None, 0
+            return None, None, 0, None
             
         # Get save directory
-        save_dir = self.get_opinion_request_dir(request_id)
+        if opinion_id is not None:
+            save_dir = self.get_opinion_dir(request_id, opinion_id)
+        else:
+            save_dir = self.get_opinion_request_dir(request_id)
         
+        file_type = self.guess_file_type(file)
+
         # Generate safe filename
-        safe_filename = f"{uuid.uuid4().hex}_{file.filename}"
-        file_path = os.path.join(save_dir, safe_filename)
+        safe_filename = f"{secrets.token_hex(16)}_{file.filename}"
+        file_path = f"{save_dir}{os.sep}{safe_filename}"
         
-        # Read and validate file
-        contents = await file.read()
-        file_size = len(contents)
-        
-        # Check file size
-        if file_size > max_size_mb * 1024 * 1024:
+        # Stream to disk off the event loop, checking size as we go
+        file_size = await asyncio.to_thread(
+            self._copy_in_chunks, file.file, file_path, max_size_mb * 1024 * 1024
+        )
+        if file_size is None:
             raise ValueError(f"File size exceeds {max_size_mb}MB limit")
             
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(contents)
-            
-        return file_path, safe_filename, file_size
+        return file_path, safe_filename, file_size, file_type
+
+    @staticmethod
+    def _copy_in_chunks(source: BinaryIO, file_path: str, max_size: int) -> Optional[int]:
+        """Copy source to file_path; returns None (and removes the file) if it exceeds max_size"""
+        size = 0
+        # O_EXCL never clobbers an existing file
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            # Buffered on purpose: BufferedWriter.write never returns after a short write
+            with open(fd, "wb") as f:
+                while chunk := source.read(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > max_size:
+                        break
+                    f.write(chunk)
+        except Exception:
+            # Don't leave a half-written file behind (e.g. ENOSPC, a failed read)
+            os.remove(file_path)
+            raise
+        if size > max_size:
+            os.remove(file_path)
+            return None
+        return size
     
     def remove_file(self, file_path: str) -> bool:
         """Remove file if it exists"""
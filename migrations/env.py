@@ -9,27 +9,10 @@ import sys
 # Add parent directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-# Import models and config
-from app.db.base_class import Base
-from app.models.auth import User, Role, Permission
-from app.models.department import Department
-from app.models.chat import ChatMessage
-from app.models.opinion import (
-    WorkflowStatus,
-    OpinionRequest,
-    Document,
-    Category,
-    SubCategory,
-    Remark,
-    RequestAssignment,
-    Opinion,
-    CommunicationType,
-    InterdepartmentalCommunication,
-    WorkflowHistory,
-)
 from app.core.config import get_settings
 
 settings = get_settings()
+db_url = settings.DATABASE_URL
 
 # This is the Alembic Config object
 config = context.config
@@ -39,16 +22,40 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # Set the database URL in the alembic.ini file
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", db_url)
 
-# Add your model's MetaData object here for 'autogenerate' support
-# Make sure all models are imported before this line
-target_metadata = Base.metadata
+# Offline runs only render the migration scripts to SQL, and plain upgrades from
+# scripts/run_migrations.py / manage_db.py (config.attributes["core_only"]) never
+# compare against the models, so neither needs the ORM model graph imported
+core_only = config.attributes.get("core_only", False)
+target_metadata = None
+if not context.is_offline_mode() and not core_only:
+    # Add your model's MetaData object here for 'autogenerate' support
+    # Make sure all models are imported before this line
+    from app.db.base_class import Base
+    from app.models.auth import User, Role, Permission
+    from app.models.department import Department
+    from app.models.chat import ChatMessage
+    from app.models.opinion import (
+        WorkflowStatus,
+        OpinionRequest,
+        Document,
+        Category,
+        SubCategory,
+        Remark,
+        RequestAssignment,
+        Opinion,
+        CommunicationType,
+        InterdepartmentalCommunication,
+        WorkflowHistory,
+    )
+    target_metadata = Base.metadata
 
 def include_object(object, name, type_, reflected, compare_to):
     """Defines which objects should be included in the migration."""
     # Add any tables that should be ignored in migrations
-    ignored_tables = []
+    # PGVector tables are created by init.sql / langchain_postgres, not by our models
+    ignored_tables = ["langchain_pg_embedding", "langchain_pg_collection"]
     if type_ == "table" and name in ignored_tables:
         return False
     return True
@@ -68,26 +75,44 @@ def run_migrations_offline() -> None:
     with context.begin_transaction():
         context.run_migrations()
 
+def do_run_migrations(connection) -> None:
+    """Run the migration scripts on an open connection."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        compare_type=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
+    # scripts/manage_db.py hands over a connection from the app engine so the
+    # CLI migrates and seeds through one pool
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL
+    configuration["sqlalchemy.url"] = db_url
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        # Alembic runs everything on one connection; keep it pooled for the whole run
+        poolclass=pool.QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        # Migrations are re-runnable, so don't wait on WAL flush for each commit
+        connect_args={"options": "-c synchronous_commit=off"},
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            include_object=include_object,
-            compare_type=True,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        do_run_migrations(connection)
+
+    connectable.dispose()
 
 if context.is_offline_mode():
     run_migrations_offline()
@@ -0,0 +1,65 @@
+"""users opinion_request_count
+
+Revision ID: 2f41c9d07a3e
+Revises: 8b728f13d96c
+Create Date: 2026-10-16 09:47:05.532918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f41c9d07a3e'
+down_revision: Union[str, None] = '8b728f13d96c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('opinion_request_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill counts for requests created before the trigger existed
+    op.execute("""
+        UPDATE users u
+        SET opinion_request_count = c.total
+        FROM (
+            SELECT requester_id, COUNT(*) AS total
+            FROM opinion_requests
+            GROUP BY requester_id
+        ) c
+        WHERE u.id = c.requester_id
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_user_opinion_request_count()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE users
+                SET opinion_request_count = opinion_request_count + 1
+                WHERE id = NEW.requester_id;
+                RETURN NEW;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE users
+                SET opinion_request_count = opinion_request_count - 1
+                WHERE id = OLD.requester_id;
+                RETURN OLD;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_opinion_requests_count
+        AFTER INSERT OR DELETE ON opinion_requests
+        FOR EACH ROW EXECUTE FUNCTION update_user_opinion_request_count()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_opinion_requests_count ON opinion_requests")
+    op.execute("DROP FUNCTION IF EXISTS update_user_opinion_request_count()")
+    op.drop_column('users', 'opinion_request_count')
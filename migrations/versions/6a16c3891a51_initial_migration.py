@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = '6a16c3891a51'
@@ -271,27 +270,11 @@ def upgrade() -> None:
     sa.PrimaryKeyConstraint('id')
     )
     op.create_index('idx_workflow_history_request', 'workflow_history', ['opinion_request_id'], unique=False)
-    op.drop_index('langchain_pg_embedding_embedding_idx', table_name='langchain_pg_embedding', postgresql_with={'lists': '100'}, postgresql_using='ivfflat')
-    op.drop_table('langchain_pg_embedding')
-    op.drop_table('langchain_pg_collection')
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    op.create_table('langchain_pg_collection',
-    sa.Column('name', sa.TEXT(), autoincrement=False, nullable=False),
-    sa.Column('cmetadata', postgresql.JSONB(astext_type=sa.Text()), autoincrement=False, nullable=True),
-    sa.PrimaryKeyConstraint('name', name='langchain_pg_collection_pkey')
-    )
-    op.create_table('langchain_pg_embedding',
-    sa.Column('uuid', sa.UUID(), autoincrement=False, nullable=False),
-    sa.Column('cmetadata', postgresql.JSONB(astext_type=sa.Text()), autoincrement=False, nullable=True),
-    sa.Column('document', sa.TEXT(), autoincrement=False, nullable=True),
-    sa.Column('embedding', sa.NullType(), autoincrement=False, nullable=True),
-    sa.PrimaryKeyConstraint('uuid', name='langchain_pg_embedding_pkey')
-    )
-    op.create_index('langchain_pg_embedding_embedding_idx', 'langchain_pg_embedding', ['embedding'], unique=False, postgresql_with={'lists': '100'}, postgresql_using='ivfflat')
     op.drop_index('idx_workflow_history_request', table_name='workflow_history')
     op.drop_table('workflow_history')
     op.drop_index('uix_request_expert', table_name='request_assignments')
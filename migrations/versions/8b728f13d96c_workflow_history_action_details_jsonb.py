@@ -0,0 +1,34 @@
+"""workflow_history action_details jsonb
+
+Revision ID: 8b728f13d96c
+Revises: 6a16c3891a51
+Create Date: 2026-10-16 09:12:40.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b728f13d96c'
+down_revision: Union[str, None] = '6a16c3891a51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE workflow_history "
+        "ALTER COLUMN action_details TYPE jsonb USING action_details::jsonb"
+    )
+    op.create_index('idx_wfh_action_details', 'workflow_history', ['action_details'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_wfh_action_details', table_name='workflow_history', postgresql_using='gin')
+    op.execute(
+        "ALTER TABLE workflow_history "
+        "ALTER COLUMN action_details TYPE json USING action_details::json"
+    )
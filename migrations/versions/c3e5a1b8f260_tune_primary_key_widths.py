@@ -0,0 +1,67 @@
+"""tune primary key widths
+
+Revision ID: c3e5a1b8f260
+Revises: 2f41c9d07a3e
+Create Date: 2026-10-16 10:21:33.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a1b8f260'
+down_revision: Union[str, None] = '2f41c9d07a3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Append-only tables that can outgrow INT4
+BIGINT_COLUMNS = [
+    ('documents', 'id', False),
+    ('interdepartmental_communications', 'id', False),
+    ('interdepartmental_communications', 'parent_communication_id', True),
+    ('workflow_history', 'id', False),
+]
+
+# Small lookup tables (<100 rows) and the foreign keys pointing at them
+SMALLINT_COLUMNS = [
+    ('workflow_status', 'id', False),
+    ('categories', 'id', False),
+    ('communication_types', 'id', False),
+    ('opinion_requests', 'current_status_id', True),
+    ('opinion_requests', 'category_id', False),
+    ('subcategories', 'category_id', True),
+    ('request_assignments', 'status_id', True),
+    ('interdepartmental_communications', 'communication_type_id', True),
+    ('workflow_history', 'from_status_id', True),
+    ('workflow_history', 'to_status_id', True),
+]
+
+BIGINT_SEQUENCES = ['documents_id_seq', 'interdepartmental_communications_id_seq', 'workflow_history_id_seq']
+SMALLINT_SEQUENCES = ['workflow_status_id_seq', 'categories_id_seq', 'communication_types_id_seq']
+
+
+def upgrade() -> None:
+    for table, column, nullable in BIGINT_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.Integer(), type_=sa.BigInteger(), existing_nullable=nullable)
+    for sequence in BIGINT_SEQUENCES:
+        op.execute(f"ALTER SEQUENCE {sequence} AS bigint")
+
+    for table, column, nullable in SMALLINT_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.Integer(), type_=sa.SmallInteger(), existing_nullable=nullable)
+    for sequence in SMALLINT_SEQUENCES:
+        op.execute(f"ALTER SEQUENCE {sequence} AS smallint")
+
+
+def downgrade() -> None:
+    for sequence in SMALLINT_SEQUENCES:
+        op.execute(f"ALTER SEQUENCE {sequence} AS integer")
+    for table, column, nullable in reversed(SMALLINT_COLUMNS):
+        op.alter_column(table, column, existing_type=sa.SmallInteger(), type_=sa.Integer(), existing_nullable=nullable)
+
+    for sequence in BIGINT_SEQUENCES:
+        op.execute(f"ALTER SEQUENCE {sequence} AS integer")
+    for table, column, nullable in reversed(BIGINT_COLUMNS):
+        op.alter_column(table, column, existing_type=sa.BigInteger(), type_=sa.Integer(), existing_nullable=nullable)
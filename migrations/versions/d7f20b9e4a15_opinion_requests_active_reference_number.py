@@ -0,0 +1,31 @@
+"""opinion requests active reference number
+
+Revision ID: d7f20b9e4a15
+Revises: c3e5a1b8f260
+Create Date: 2026-10-16 11:02:47.215830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f20b9e4a15'
+down_revision: Union[str, None] = 'c3e5a1b8f260'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('opinion_requests_reference_number_key', 'opinion_requests', type_='unique')
+    op.create_index(
+        'uix_opreq_refnum_active', 'opinion_requests', ['reference_number'],
+        unique=True, postgresql_where=sa.text('is_deleted IS false')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uix_opreq_refnum_active', table_name='opinion_requests')
+    op.create_unique_constraint('opinion_requests_reference_number_key', 'opinion_requests', ['reference_number'])
@@ -0,0 +1,60 @@
+"""directory materialized views
+
+Revision ID: e41a7c95d2b8
+Revises: d7f20b9e4a15
+Create Date: 2026-10-16 13:18:52.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41a7c95d2b8'
+down_revision: Union[str, None] = 'd7f20b9e4a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Precomputed joins/aggregates behind `manage_db.py list`; refreshed by `manage_db.py refresh`
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_user_directory AS
+        SELECT u.id AS user_id, r.id AS role_id,
+               u.username, u.email, d.code AS department, r.name AS role, u.is_superuser
+        FROM users u
+        LEFT JOIN department d ON u.department_id = d.id
+        LEFT JOIN user_roles ur ON u.id = ur.user_id
+        LEFT JOIN roles r ON ur.role_id = r.id
+    """)
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_role_permissions_agg AS
+        SELECT r.id AS role_id, r.name, r.description,
+               STRING_AGG(p.name, ', ') AS permissions
+        FROM roles r
+        LEFT JOIN role_permissions rp ON r.id = rp.role_id
+        LEFT JOIN permissions p ON rp.permission_id = p.id
+        GROUP BY r.id, r.name, r.description
+    """)
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_department_counts AS
+        SELECT d.id AS department_id, d.code, d.name, d.description,
+               COUNT(u.id) AS user_count
+        FROM department d
+        LEFT JOIN users u ON d.id = u.department_id
+        GROUP BY d.id, d.code, d.name, d.description
+    """)
+
+    # REFRESH ... CONCURRENTLY needs a unique index on each view
+    op.create_index('uix_mv_user_directory', 'mv_user_directory', ['user_id', 'role_id'], unique=True)
+    op.create_index('ix_mv_user_directory_username', 'mv_user_directory', ['username'])
+    op.create_index('uix_mv_role_permissions_agg', 'mv_role_permissions_agg', ['role_id'], unique=True)
+    op.create_index('uix_mv_department_counts', 'mv_department_counts', ['department_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_department_counts")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_role_permissions_agg")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_directory")
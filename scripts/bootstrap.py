@@ -0,0 +1,28 @@
+# scripts/bootstrap.py
+import sys
+from pathlib import Path
+from alembic import command
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scripts.manage_db import cli, engine, get_alembic_config
+
+def autogenerate_revision(message: str = "Initial_migration"):
+    """Write a migration for model changes, on the shared engine"""
+    alembic_cfg = get_alembic_config()
+    with engine.begin() as connection:
+        alembic_cfg.attributes["connection"] = connection
+        try:
+            command.revision(alembic_cfg, message=message, autogenerate=True)
+        finally:
+            alembic_cfg.attributes.pop("connection", None)
+
+def main():
+    """Create migrations, apply them and seed the database in one interpreter"""
+    autogenerate_revision()
+    # `init` runs the upgrade itself before seeding
+    cli(["init", "--force"], standalone_mode=False)
+
+if __name__ == "__main__":
+    main()
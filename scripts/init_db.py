@@ -3,6 +3,7 @@ import os
 import sys
 from pathlib import Path
 import alembic.config
+from alembic.command import init as alembic_init
 
 def main():
     # Get the directory containing this script
@@ -14,7 +15,7 @@ def main():
 
     # Initialize Alembic if not already initialized
     if not os.path.exists("alembic"):
-        os.system("alembic init alembic")
+        alembic_init(alembic.config.Config("alembic.ini"), directory="alembic")
 
     # Run Alembic migrations
     alembicArgs = [
@@ -1,6 +1,7 @@
 # scripts/manage_db.py
 import sys
 import click
+from functools import lru_cache
 from pathlib import Path
 from alembic import command
 from alembic.config import Config
@@ -8,23 +9,67 @@ from alembic.config import Config
 # Add parent directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, engine, no_expire_on_commit
 from app.initial_data import init_db, init_permissions, init_roles, init_departments, init_default_users
 from sqlalchemy import text
 
+@lru_cache(maxsize=1)
+def get_alembic_config() -> Config:
+    """Parse alembic.ini once per process"""
+    return Config("alembic.ini")
+
 def run_migrations():
     """Run database migrations"""
     try:
-        # Create Alembic configuration
-        alembic_cfg = Config("alembic.ini")
+        alembic_cfg = get_alembic_config()
         
-        # Run the migrations
-        command.upgrade(alembic_cfg, "head")
+        # Run the migrations on the shared engine instead of a second one built by env.py
+        with engine.begin() as connection:
+            alembic_cfg.attributes["connection"] = connection
+            # Upgrades never autogenerate, so env.py can skip the model imports
+            alembic_cfg.attributes["core_only"] = True
+            try:
+                command.upgrade(alembic_cfg, "head")
+            finally:
+                # The cached config outlives this call; don't leak either into later commands
+                alembic_cfg.attributes.pop("connection", None)
+                alembic_cfg.attributes.pop("core_only", None)
         return True
     except Exception as e:
         click.echo(f"Error running migrations: {e}", err=True)
         return False
 
+# Kept current by the `refresh` command; see the directory_materialized_views migration
+MATERIALIZED_VIEWS = ['mv_user_directory', 'mv_role_permissions_agg', 'mv_department_counts']
+
+def refresh_views():
+    """Recompute the list materialized views without blocking readers"""
+    with engine.begin() as conn:
+        for view in MATERIALIZED_VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+
+def fetch_all(sql: str):
+    """Run a read-only query on a raw DB-API cursor and return plain tuples"""
+    conn = engine.raw_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute(sql)
+        return cur.fetchall()
+    finally:
+        conn.close()
+
+def stream_rows(sql: str, batch_size: int = 500):
+    """Yield rows from a server-side cursor, fetching batch_size rows per round-trip"""
+    conn = engine.raw_connection()
+    try:
+        # A named psycopg2 cursor DECLAREs the query on the server instead of buffering it all
+        cur = conn.cursor(name="manage_db_list")
+        cur.itersize = batch_size
+        cur.execute(sql)
+        yield from cur
+    finally:
+        conn.close()
+
 @click.group()
 def cli():
     """Database management commands for ADEO application"""
@@ -46,17 +91,23 @@ def init(force):
             # Clean existing data
             click.echo("Forcing reinitialization... Cleaning existing data...")
             try:
-                db.execute(text("""
-                    TRUNCATE TABLE users, roles, permissions, department, 
-                    user_roles, role_permissions RESTART IDENTITY CASCADE;
-                """))
-                db.commit()
+                # Own transaction on the engine: it commits, releasing the ACCESS EXCLUSIVE
+                # locks, before the seed session below opens its first connection
+                with engine.begin() as conn:
+                    conn.execute(text("""
+                        TRUNCATE TABLE users, roles, permissions, department, 
+                        user_roles, role_permissions RESTART IDENTITY CASCADE;
+                    """))
             except Exception as e:
                 click.echo(f"Error cleaning data (this is normal for first run): {e}")
-                db.rollback()
         
         click.echo("Initializing database...")
-        init_db(db)
+        # Seeders commit per entity type and reuse earlier rows' IDs; don't reload them after each commit
+        with no_expire_on_commit(db):
+            init_db(db)
+        
+        click.echo("Refreshing materialized views...")
+        refresh_views()
         click.echo("Database initialization completed successfully!")
         
     except Exception as e:
@@ -65,18 +116,28 @@ def init(force):
     finally:
         db.close()
 
+@cli.command()
+def refresh():
+    """Refresh the materialized views behind the list command"""
+    try:
+        refresh_views()
+        click.echo("Materialized views refreshed.")
+    except Exception as e:
+        click.echo(f"Error refreshing materialized views: {e}", err=True)
+        sys.exit(1)
+
 @cli.command()
 def verify():
     """Verify database initialization status"""
-    db = SessionLocal()
     try:
-        # Check each table
+        # Check each table, plus the superuser count, in one round-trip
         tables = ['users', 'roles', 'permissions', 'department']
-        status = {}
-        
-        for table in tables:
-            result = db.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
-            status[table] = result
+        counts = fetch_all(
+            "SELECT "
+            + ", ".join(f"(SELECT COUNT(*) FROM {table}) AS {table}_ct" for table in tables)
+            + ", (SELECT COUNT(*) FROM users WHERE is_superuser = true) AS super_admin_ct"
+        )[0]
+        status = dict(zip(tables, counts))
         
         click.echo("\nDatabase Status:")
         click.echo("================")
@@ -88,94 +149,81 @@ def verify():
         click.echo("==================")
         
         # Check Super Admin
-        super_admin = db.execute(text("SELECT COUNT(*) FROM users WHERE is_superuser = true")).scalar()
+        super_admin = counts[-1]
         click.echo(f"Super Admin users: {super_admin}")
         
         # Check departments
-        dept_list = db.execute(text("SELECT code, name FROM department")).fetchall()
+        dept_list = fetch_all("SELECT code, name FROM department")
         click.echo("\nDepartments:")
-        for dept in dept_list:
-            click.echo(f"- {dept.code}: {dept.name}")
+        for code, name in dept_list:
+            click.echo(f"- {code}: {name}")
         
         # Check roles
-        role_list = db.execute(text("SELECT name FROM roles")).fetchall()
+        role_list = fetch_all("SELECT name FROM roles")
         click.echo("\nRoles:")
-        for role in role_list:
-            click.echo(f"- {role.name}")
+        for (name,) in role_list:
+            click.echo(f"- {name}")
             
     except Exception as e:
         click.echo(f"Error verifying database: {e}", err=True)
         sys.exit(1)
-    finally:
-        db.close()
 
 @cli.command()
 @click.option('--type', 'entity_type', type=click.Choice(['users', 'roles', 'department', 'permissions']), 
               help='Type of entity to list')
 def list(entity_type):
     """List entities in the database"""
-    db = SessionLocal()
     try:
         if entity_type == 'users':
-            result = db.execute(text("""
-                SELECT u.username, u.email, d.code as department, r.name as role, u.is_superuser
-                FROM users u
-                LEFT JOIN department d ON u.department_id = d.id
-                LEFT JOIN user_roles ur ON u.id = ur.user_id
-                LEFT JOIN roles r ON ur.role_id = r.id
-                ORDER BY u.username
-            """)).fetchall()
+            result = stream_rows("""
+                SELECT username, email, department, role, is_superuser
+                FROM mv_user_directory
+                ORDER BY username
+            """)
             
             click.echo("\nUsers:")
             click.echo("=======")
             for user in result:
-                click.echo(f"Username: {user.username}")
-                click.echo(f"Email: {user.email}")
-                click.echo(f"Department: {user.department}")
-                click.echo(f"Role: {user.role}")
-                click.echo(f"Is Superuser: {user.is_superuser}")
+                click.echo(f"Username: {user[0]}")
+                click.echo(f"Email: {user[1]}")
+                click.echo(f"Department: {user[2]}")
+                click.echo(f"Role: {user[3]}")
+                click.echo(f"Is Superuser: {user[4]}")
                 click.echo("---")
                 
         elif entity_type == 'roles':
-            result = db.execute(text("""
-                SELECT r.name, r.description, 
-                       STRING_AGG(p.name, ', ') as permissions
-                FROM roles r
-                LEFT JOIN role_permissions rp ON r.id = rp.role_id
-                LEFT JOIN permissions p ON rp.permission_id = p.id
-                GROUP BY r.id, r.name, r.description
-                ORDER BY r.name
-            """)).fetchall()
+            result = stream_rows("""
+                SELECT name, description, permissions
+                FROM mv_role_permissions_agg
+                ORDER BY name
+            """)
             
             click.echo("\nRoles:")
             click.echo("=======")
-            for role in result:
-                click.echo(f"Name: {role.name}")
-                click.echo(f"Description: {role.description}")
-                click.echo(f"Permissions: {role.permissions}")
+            for name, description, permissions in result:
+                click.echo(f"Name: {name}")
+                click.echo(f"Description: {description}")
+                click.echo(f"Permissions: {permissions}")
                 click.echo("---")
                 
         elif entity_type == 'department':
-            result = db.execute(text("""
-                SELECT d.code, d.name, d.description,
-                       COUNT(u.id) as user_count
-                FROM department d
-                LEFT JOIN users u ON d.id = u.department_id
-                GROUP BY d.id, d.code, d.name, d.description
-                ORDER BY d.code
-            """)).fetchall()
+            result = stream_rows("""
+                SELECT code, name, description, user_count
+                FROM mv_department_counts
+                ORDER BY code
+            """)
             
             click.echo("\nDepartments:")
             click.echo("============")
-            for dept in result:
-                click.echo(f"Code: {dept.code}")
-                click.echo(f"Name: {dept.name}")
-                click.echo(f"Description: {dept.description}")
-                click.echo(f"Users: {dept.user_count}")
+            for code, name, description, user_count in result:
+                click.echo(f"Code: {code}")
+                click.echo(f"Name: {name}")
+                click.echo(f"Description: {description}")
+                click.echo(f"Users: {user_count}")
                 click.echo("---")
                 
         elif entity_type == 'permissions':
-            result = db.execute(text("""
+            result = stream_rows("""
                 SELECT p.name, p.description,
                        COUNT(DISTINCT r.id) as role_count
                 FROM permissions p
@@ -183,21 +231,19 @@ def list(entity_type):
                 LEFT JOIN roles r ON rp.role_id = r.id
                 GROUP BY p.id, p.name, p.description
                 ORDER BY p.name
-            """)).fetchall()
+            """)
             
             click.echo("\nPermissions:")
             click.echo("============")
-            for perm in result:
-                click.echo(f"Name: {perm.name}")
-                click.echo(f"Description: {perm.description}")
-                click.echo(f"Used in roles: {perm.role_count}")
+            for name, description, role_count in result:
+                click.echo(f"Name: {name}")
+                click.echo(f"Description: {description}")
+                click.echo(f"Used in roles: {role_count}")
                 click.echo("---")
     
     except Exception as e:
         click.echo(f"Error listing entities: {e}", err=True)
         sys.exit(1)
-    finally:
-        db.close()
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
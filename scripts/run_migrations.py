@@ -2,7 +2,8 @@
 import os
 import sys
 from pathlib import Path
-import alembic.config
+from alembic import command
+from alembic.config import Config
 
 def main():
     # Get the directory containing this script
@@ -13,11 +14,10 @@ def main():
     os.chdir(project_root)
 
     # Run Alembic migrations
-    alembicArgs = [
-        '--raiseerr',
-        'upgrade', 'head',
-    ]
-    alembic.config.main(argv=alembicArgs)
+    alembic_cfg = Config("alembic.ini")
+    # Upgrades only run DDL; skip importing the ORM models in env.py
+    alembic_cfg.attributes["core_only"] = True
+    command.upgrade(alembic_cfg, "head")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
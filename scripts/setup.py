@@ -1,84 +1,126 @@
 # scripts/setup.py
-import time
+import asyncio
+import json
 import sys
-import subprocess
+import urllib.request
 from pathlib import Path
 
-def run_command(command, ignore_errors=False):
-    """Run a command and return its success status"""
+HEALTH_URL = "http://localhost:8000/health"
+
+async def run_command(*args, ignore_errors=False):
+    """Run a command, stream its output and return its success status"""
+    print(f"\nExecuting: {' '.join(args)}")
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT
+    )
+    # Print as lines arrive instead of buffering the whole output
+    async for line in process.stdout:
+        print(line.decode(errors="replace"), end="")
+    returncode = await process.wait()
+    if returncode != 0 and not ignore_errors:
+        print(f"Error executing: {' '.join(args)}")
+        return False
+    return True
+
+async def wait_for_tcp(host, port, timeout=60):
+    """Poll until a TCP port accepts connections, backing off from 100ms to 1s"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.1
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            await writer.wait_closed()
+            return True
+        except OSError:
+            if loop.time() >= deadline:
+                print(f"Timed out waiting for {host}:{port}")
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1)
+
+def _is_healthy(url):
+    """True once the API reports it can reach the database"""
     try:
-        process = subprocess.run(
-            command,
-            shell=True,
-            check=True,
-            text=True,
-            capture_output=True
-        )
-        print(process.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        if not ignore_errors:
-            print(f"Error output: {e.stderr}")
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return json.load(response).get("status") == "healthy"
+    except (OSError, ValueError):
+        return False
+
+async def wait_for_health(url, timeout=60):
+    """Poll the API health endpoint, backing off from 100ms to 1s"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.1
+    while not await asyncio.to_thread(_is_healthy, url):
+        if loop.time() >= deadline:
+            print(f"Timed out waiting for {url}")
             return False
-        return True
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 1)
+    return True
 
 def ensure_migrations_directory():
     """Ensure migrations directory exists with __init__.py"""
     migrations_path = Path("migrations")
     versions_path = migrations_path / "versions"
-    
+
     migrations_path.mkdir(exist_ok=True)
     versions_path.mkdir(exist_ok=True)
-    
+
     # Create __init__.py files
     (migrations_path / "__init__.py").touch()
     (versions_path / "__init__.py").touch()
 
-def main():
+async def main():
     """Run the complete setup process"""
     print("Starting setup process...")
-    
+
     # Clean and build
     print("\nCleaning and building containers...")
-    commands = [
-        "docker-compose down -v",
-        "docker system prune -f",
-        "docker-compose build",
-        "docker-compose up -d",
-    ]
-    
-    for cmd in commands:
-        print(f"\nExecuting: {cmd}")
-        if not run_command(cmd):
-            print(f"Error executing: {cmd}")
+    for cmd in (
+        ["docker-compose", "down", "-v"],
+        ["docker", "system", "prune", "-f"],
+    ):
+        if not await run_command(*cmd):
             sys.exit(1)
-    
+
+    # Only the api image is built locally; db and pgadmin images can be pulled meanwhile
+    results = await asyncio.gather(
+        run_command("docker-compose", "build", "api"),
+        run_command("docker-compose", "pull", "db", "pgadmin"),
+    )
+    if not all(results):
+        sys.exit(1)
+
+    if not await run_command("docker-compose", "up", "-d"):
+        sys.exit(1)
+
     print("\nWaiting for services to be ready...")
-    time.sleep(5)
-    
+    ready = await asyncio.gather(
+        wait_for_tcp("localhost", 5432),
+        wait_for_health(HEALTH_URL),
+    )
+    if not all(ready):
+        sys.exit(1)
+
     # Set up migrations
     print("\nSetting up database migrations...")
     ensure_migrations_directory()
-    
-    # Create and run migrations
-    migration_commands = [
-        'docker-compose exec -T api alembic revision --autogenerate -m "Initial_migration"',
-        "docker-compose exec -T api alembic upgrade head"
-    ]
-    
-    for cmd in migration_commands:
-        print(f"\nExecuting: {cmd}")
-        if not run_command(cmd):
-            print(f"Error executing: {cmd}")
-            sys.exit(1)
-    
-    # Initialize data
+
+    # Autogenerate, migrate and seed in one exec / one interpreter inside the container
     print("\nInitializing database data...")
-    if not run_command("docker-compose exec -T api python scripts/manage_db.py init --force"):
+    if not await run_command(
+        "docker-compose", "exec", "-T", "api",
+        "python", "-m", "scripts.bootstrap"
+    ):
         print("Error initializing database data")
         sys.exit(1)
-    
+
     print("\nSetup completed successfully!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
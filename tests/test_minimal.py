@@ -1,11 +1,12 @@
 # tests/test_minimal.py
 import asyncio
+from collections import deque
 import socketio
 import logging
 from datetime import datetime, UTC
 import os
 from dotenv import load_dotenv
-import json
+import orjson
 
 # Load environment variables
 load_dotenv()
@@ -23,14 +24,50 @@ logging.getLogger('engineio').setLevel(logging.ERROR)
 logging.getLogger('socketio').setLevel(logging.ERROR)
 logging.getLogger('urllib3').setLevel(logging.ERROR)
 
-class ChatTester:
-    def __init__(self):
-        self.sio = socketio.AsyncClient(logger=False)
-        self.setup_event_handlers()
-        self.responses_received = 0
-        self.test_complete = asyncio.Event()
+# Seconds to wait for the server to acknowledge a sent message. The server emits
+# the user_message ack only after it has streamed and saved the whole AI reply,
+# so this has to cover a full LLM response, not just a round trip.
+ACK_TIMEOUT = 180
+
+class ChatClient:
+    """One Socket.IO connection shared by every test scenario"""
+    def __init__(self, sio: socketio.AsyncClient):
+        self.sio = sio
         self.connected = asyncio.Event()
         self.authenticated = asyncio.Event()
+        # correlation_id -> ChatTester
+        self.testers = {}
+        # Sent message content -> correlation_ids waiting for its ack, in send order.
+        # Acks echo only the content, and scenarios may send identical messages.
+        self.ack_routes = {}
+        # ai_message_complete payloads not yet claimed by an ack
+        self.unclaimed_replies = deque()
+        self.setup_event_handlers()
+
+    def register(self, tester):
+        self.testers[tester.correlation_id] = tester
+
+    def take_ack_route(self, content: str):
+        """Pop the oldest correlation_id still waiting for an ack of this content"""
+        waiting = self.ack_routes.get(content)
+        if not waiting:
+            return None
+        correlation_id = waiting.popleft()
+        if not waiting:
+            del self.ack_routes[content]
+        return correlation_id
+
+    def drop_ack_route(self, tester, message: str):
+        """Forget a tester's send that timed out so a late ack can't be misrouted"""
+        waiting = self.ack_routes.get(message)
+        if waiting and tester.correlation_id in waiting:
+            waiting.remove(tester.correlation_id)
+            if not waiting:
+                del self.ack_routes[message]
+
+    def fail_all(self):
+        for tester in self.testers.values():
+            tester.test_complete.set()
 
     def setup_event_handlers(self):
         @self.sio.event
@@ -41,7 +78,7 @@ class ChatTester:
         @self.sio.event
         async def connect_error(data):
             logger.error(f"Connection error: {data}")
-            self.test_complete.set()
+            self.fail_all()
 
         @self.sio.event
         async def disconnect():
@@ -56,27 +93,34 @@ class ChatTester:
                 self.authenticated.set()
             else:
                 logger.error(f"Authentication failed: {data}")
-                self.test_complete.set()
+                self.fail_all()
 
         @self.sio.event
         async def message_received(data):
-            logger.info(f"Message received: {json.dumps(data, indent=2)}")
-            if data.get('type') == 'user_message':
-                logger.info("User message acknowledged by server")
-            elif data.get('type') == 'ai_message':
-                logger.info("-" * 50)
-                logger.info("AI Response received:")
-                logger.info(f"Content: {data['message']['content']}")
-                logger.info(f"Timestamp: {data['message']['timestamp']}")
-                logger.info("-" * 50)
-                self.responses_received += 1
-                if self.responses_received >= self.expected_responses:
-                    self.test_complete.set()
+            logger.info(f"Message received: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}")
+            if data.get('type') == 'ai_message_complete':
+                # Replies echo neither the prompt nor the correlation_id. The server
+                # emits a message's reply just before its ack, so the ack claims it.
+                self.unclaimed_replies.append(data)
+            elif data.get('type') == 'user_message':
+                tester = self.testers.get(self.take_ack_route(data['message']['content']))
+                reply = self.unclaimed_replies.popleft() if self.unclaimed_replies else None
+                if tester:
+                    tester.on_acknowledged(data, reply)
 
         @self.sio.event
         async def error(data):
             logger.error(f"Server error: {data.get('message', 'Unknown error')}")
-            self.test_complete.set()
+            self.fail_all()
+
+    async def connect(self):
+        """Open the shared connection once for all scenarios"""
+        await self.sio.connect(
+            'http://localhost:8000',
+            transports=['websocket'],
+            socketio_path='socket.io',
+            wait_timeout=10
+        )
 
     async def authenticate(self, user_id: int = 1):
         """Authenticate with the server"""
@@ -90,22 +134,59 @@ class ChatTester:
                 await asyncio.wait_for(self.authenticated.wait(), timeout=5)
             except asyncio.TimeoutError:
                 logger.error("Authentication timeout")
-                self.test_complete.set()
+                self.fail_all()
         except Exception as e:
             logger.error(f"Authentication error: {str(e)}")
-            self.test_complete.set()
+            self.fail_all()
+
+    async def send(self, tester, message: str):
+        """Emit a chat message on behalf of a tester"""
+        self.ack_routes.setdefault(message, deque()).append(tester.correlation_id)
+        await self.sio.emit('chat_message', {
+            'content': message,
+            'user_id': 1,  # Use integer ID
+            'correlation_id': tester.correlation_id,
+            'timestamp': datetime.now(UTC).isoformat()
+        })
+
+    async def close(self):
+        if self.sio.connected:
+            await self.sio.disconnect()
+
+class ChatTester:
+    def __init__(self, client: ChatClient, correlation_id: str):
+        self.client = client
+        self.correlation_id = correlation_id
+        self.responses_received = 0
+        self.expected_responses = 0
+        self.test_complete = asyncio.Event()
+        # Sent message content -> event set when the server acknowledges it
+        self.pending_acks = {}
+        client.register(self)
+
+    def on_acknowledged(self, data, reply):
+        """Handle the server's ack of a sent message and the AI reply that preceded it"""
+        logger.info(f"[{self.correlation_id}] User message acknowledged by server")
+        if reply:
+            # With scenarios running side by side, two replies that finish together
+            # can be claimed crosswise; the per-scenario count is still exact
+            logger.info("-" * 50)
+            logger.info(f"[{self.correlation_id}] AI Response received:")
+            logger.info(f"Content: {reply['message']['content']}")
+            logger.info(f"Timestamp: {reply['message']['timestamp']}")
+            logger.info("-" * 50)
+            self.responses_received += 1
+            if self.responses_received >= self.expected_responses:
+                self.test_complete.set()
+        ack = self.pending_acks.pop(data['message']['content'], None)
+        if ack:
+            ack.set()
 
     async def send_test_message(self):
         """Send a test message to the chat server"""
         try:
-            # Wait for connection before sending messages
-            await self.connected.wait()
-            
-            # Authenticate first
-            await self.authenticate(user_id=1)
-
             # Only proceed if authenticated
-            if not self.authenticated.is_set():
+            if not self.client.authenticated.is_set():
                 logger.error("Not authenticated, skipping messages")
                 return
 
@@ -118,18 +199,22 @@ class ChatTester:
             self.expected_responses = len(test_messages)
             
             for message in test_messages:
-                if not self.connected.is_set():
+                if not self.client.connected.is_set():
                     logger.error("Connection lost, stopping messages")
                     break
                     
-                logger.info(f"Sending test message: {message}")
-                await self.sio.emit('chat_message', {
-                    'content': message,
-                    'user_id': 1,  # Use integer ID
-                    'timestamp': datetime.now(UTC).isoformat()
-                })
-                # Add small delay between messages
-                await asyncio.sleep(2)
+                logger.info(f"[{self.correlation_id}] Sending test message: {message}")
+                ack = asyncio.Event()
+                self.pending_acks[message] = ack
+                await self.client.send(self, message)
+                # The ack follows the full reply, so messages within a scenario go one at a
+                # time; the concurrency comes from running scenarios side by side
+                try:
+                    await asyncio.wait_for(ack.wait(), timeout=ACK_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning(f"No acknowledgement for message: {message}")
+                    self.pending_acks.pop(message, None)
+                    self.client.drop_ack_route(self, message)
 
         except Exception as e:
             logger.error(f"Error sending test message: {str(e)}", exc_info=True)
@@ -138,39 +223,43 @@ class ChatTester:
     async def run_test(self):
         """Run the chat test"""
         try:
-            logger.info("Starting chat test")
-            await self.sio.connect(
-                'http://localhost:8000',
-                transports=['websocket'],
-                socketio_path='socket.io',
-                wait_timeout=10
-            )
+            logger.info(f"Starting chat test {self.correlation_id}")
             
             # Start sending messages
             await self.send_test_message()
             
             # Wait for test completion or timeout
             try:
-                await asyncio.wait_for(self.test_complete.wait(), timeout=30)
+                await asyncio.wait_for(self.test_complete.wait(), timeout=ACK_TIMEOUT)
             except asyncio.TimeoutError:
                 logger.warning("Test timed out waiting for responses")
             
         except Exception as e:
             logger.error(f"Test error: {str(e)}", exc_info=True)
         finally:
-            if self.sio.connected:
-                await self.sio.disconnect()
-            logger.info(f"Test completed. Received {self.responses_received} responses")
+            logger.info(f"Test {self.correlation_id} completed. Received {self.responses_received} responses")
 
 async def run_chat_tests():
     """Run multiple test scenarios"""
+    # Connect and authenticate once; scenarios multiplex over the same socket
+    client = ChatClient(socketio.AsyncClient(logger=False))
     test_scenarios = [
-        ChatTester(),
+        ChatTester(client, correlation_id="scenario-1"),
+        ChatTester(client, correlation_id="scenario-2"),
     ]
     
-    for scenario in test_scenarios:
-        await scenario.run_test()
-        await asyncio.sleep(2)
+    try:
+        logger.info("Connecting to chat server")
+        await client.connect()
+        await client.connected.wait()
+        await client.authenticate(user_id=1)
+        
+        # The server handles each chat_message in its own task, so scenarios overlap
+        await asyncio.gather(*(scenario.run_test() for scenario in test_scenarios))
+    except Exception as e:
+        logger.error(f"Test error: {str(e)}", exc_info=True)
+    finally:
+        await client.close()
 
 def main():
     """Main entry point for running tests"""
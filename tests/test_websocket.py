@@ -1,17 +1,21 @@
 # tests/test_websocket.py
 import asyncio
+import os
 import socketio
 import logging
 from datetime import datetime
 
-logging.basicConfig(level=logging.DEBUG)
+# Per-packet Socket.IO/Engine.IO logging only when WS_TEST_DEBUG=1
+DEBUG = os.getenv("WS_TEST_DEBUG") == "1"
+
+logging.basicConfig(level=logging.DEBUG if DEBUG else logging.WARNING)
 logger = logging.getLogger(__name__)
 
 async def test_chat():
     # Initialize client with specific Engine.IO version
     sio = socketio.AsyncClient(
-        logger=True,
-        engineio_logger=True,
+        logger=DEBUG,
+        engineio_logger=DEBUG,
         ssl_verify=False
     )
     
@@ -28,9 +32,12 @@ async def test_chat():
     async def disconnect():
         logger.info("Disconnected!")
         
+    response_received = asyncio.Event()
+    
     @sio.on('response')
     async def on_response(data):
         logger.info(f"Received response: {data}")
+        response_received.set()
         
     @sio.on('error')
     async def on_error(data):
@@ -59,7 +66,11 @@ async def test_chat():
             await sio.emit('message', {'text': 'Test message'})
             
             # Wait for response
-            await asyncio.sleep(3)
+            try:
+                await asyncio.wait_for(response_received.wait(), timeout=3)
+            except asyncio.TimeoutError:
+                logger.error("No response received within 3 seconds")
+                return
         else:
             logger.error("Failed to connect")
             